@@ -15,6 +15,7 @@ Provides shared functionality for all block model types (regular, sub-blocked, o
 including data access, attribute management, reports, and versioning.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Literal
 from uuid import UUID
@@ -382,15 +383,15 @@ class BaseTypedBlockModel(ABC):
         """
         fb.progress(0.0, "Refreshing block model...")
 
-        self._metadata = await self._client.get_block_model(self._metadata.id)
-
-        table = await self._client.query_block_model_as_table(
-            bm_id=self._metadata.id,
-            columns=["*"],
+        # The metadata, data and version requests are independent, so issue them concurrently.
+        bm_id = self._metadata.id
+        self._metadata, table, versions = await asyncio.gather(
+            self._client.get_block_model(bm_id),
+            self._client.query_block_model_as_table(bm_id=bm_id, columns=["*"]),
+            self._client.list_versions(bm_id),
         )
         self._cell_data = table.to_pandas()
 
-        versions = await self._client.list_versions(self._metadata.id)
         if versions:
             self._version = versions[0]
 
@@ -145,12 +145,13 @@ class RegularBlockModel(BaseTypedBlockModel):
         """Get the IContext for this block model."""
         if self._context is not None:
             return self._context
-        # Build a context from the client's internal state
-        return StaticContext.from_environment(
+        # Build a context from the client's internal state, once, so later operations reuse it
+        self._context = StaticContext.from_environment(
             environment=self._client._environment,
             connector=self._client._connector,
             cache=self._client._cache,
         )
+        return self._context
 
     @classmethod
     async def create(
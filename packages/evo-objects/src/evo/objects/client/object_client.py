@@ -310,9 +310,12 @@ class DownloadedObject(IContext):
                 if isinstance(resolved, jmespath.JMESPathArrayProxy) and len(resolved) == 1:
                     resolved = resolved[0]
                 if isinstance(resolved, jmespath.JMESPathObjectProxy):
-                    value = resolved.raw
+                    # Values resolved from the object document are well-typed JSON from the service, so strict mode
+                    # can skip the coercion paths
+                    return validator.validate_python(resolved.raw, strict=True)
                 else:
                     raise ValueError(f"Expected object, got {type(resolved)}")
+            # Values passed in by the caller may rely on coercion, so they are validated in lax mode
             return validator.validate_python(value)
 
         def _validate_nan_values(self, nan_values: list[int] | list[float] | str | None) -> list[int] | list[float]:
@@ -333,21 +336,27 @@ class DownloadedObject(IContext):
                     nan_values = resolved.raw["values"]
                 else:
                     raise ValueError(f"Expected list, got {type(resolved)}")
+            if not nan_values:
+                # Most attributes have no NaN values, so skip validation for the common empty case
+                return []
+            if isinstance(nan_values, list) and (
+                all(type(value) is int for value in nan_values) or all(type(value) is float for value in nan_values)
+            ):
+                # Already a homogeneous list of ints or floats, so validation would return an equal list
+                return nan_values
             return _NAN_VALIDATOR.validate_python(nan_values)
 
         @contextlib.asynccontextmanager
         async def _with_parquet_loader(
-            self, table_info: TableInfo | str, fb: IFeedback
+            self, table_info: TableInfo, fb: IFeedback
         ) -> AsyncGenerator[ParquetLoader, None]:
-            """Download parquet data and get a ParquetLoader for the data referenced by the given
-            table info or data reference string.
+            """Download parquet data and get a ParquetLoader for the data referenced by the given table info.
 
-            :param table_info: The table info dict, JMESPath to table info within the object.
+            :param table_info: The table info dict, which must already have been validated.
             :param fb: An optional feedback instance to report download progress to.
 
             :returns: A ParquetLoader that can be used to read the referenced data.
             """
-            table_info = self._validate_typed_dict(table_info, _TABLE_INFO_VALIDATOR)
             (download,) = self.prepare_data_download([table_info["data"]])
             async with ParquetDownloader(download, self._connector.transport, self._cache).with_feedback(fb) as loader:
                 loader.validate_with_table_info(table_info)
@@ -371,23 +380,44 @@ class DownloadedObject(IContext):
 
             :returns: A PyArrow Table containing the downloaded data.
             """
+            table_info = self._validate_typed_dict(table_info, _TABLE_INFO_VALIDATOR)
+            return await self._download_table(table_info, fb, nan_values=nan_values, column_names=column_names)
+
+        async def _download_table(
+            self,
+            table_info: TableInfo,
+            fb: IFeedback,
+            *,
+            nan_values: list[int] | list[float] | str | None,
+            column_names: Sequence[str] | None,
+        ) -> pa.Table:
+            """Download the data referenced by table info that has already been validated."""
             async with self._with_parquet_loader(table_info, fb) as loader:
                 table = loader.load_as_table()
 
+            nan_values = self._validate_nan_values(nan_values)
             if column_names is None:
+                if len(nan_values) == 0:
+                    # Nothing to replace or rename, so the loaded table can be returned as-is.
+                    return table
                 column_names = table.column_names
 
-            nan_values = self._validate_nan_values(nan_values)
             if len(nan_values) == 0:
                 return table.rename_columns(column_names)
 
-            # Replace specified nan_values with nulls
+            # Replace specified nan_values with nulls. Columns usually share a type, so build the null scalar and nan
+            # value array once per type rather than once per column.
             arrays = []
+            replacements: dict[pa.DataType, tuple[pa.Scalar, pa.Array]] = {}
             for array in table.columns:
                 if isinstance(array, pa.ChunkedArray):
                     array = array.combine_chunks()
-                null_scalar = pa.scalar(None, type=array.type)
-                nan_value_array = pa.array(nan_values, type=array.type)
+                if (replacement := replacements.get(array.type)) is None:
+                    replacement = replacements[array.type] = (
+                        pa.scalar(None, type=array.type),
+                        pa.array(nan_values, type=array.type),
+                    )
+                null_scalar, nan_value_array = replacement
                 arrays.append(pc.replace_with_mask(array, pc.is_in(array, nan_value_array), null_scalar))
             return pa.Table.from_arrays(arrays, names=column_names)
 
@@ -412,7 +442,23 @@ class DownloadedObject(IContext):
             :returns: A PyArrow Table containing the downloaded data.
             """
             category_info = self._validate_typed_dict(category_info, _CATEGORY_INFO_VALIDATOR)
+            return await self._download_category_table(
+                category_info, nan_values=nan_values, column_names=column_names, fb=fb
+            )
 
+        async def _download_category_table(
+            self,
+            category_info: CategoryInfo,
+            *,
+            nan_values: list[int] | list[float] | str | None,
+            column_names: Sequence[str] | None,
+            fb: IFeedback,
+        ) -> pa.Table:
+            """Download the data referenced by category info that has already been validated.
+
+            The nested values and lookup table infos were validated along with the category info, so they are downloaded
+            without validating them again.
+            """
             v_size = (
                 category_info["values"]["length"] * category_info["values"]["width"]
             )  # Total number of cells in values
@@ -420,13 +466,15 @@ class DownloadedObject(IContext):
             values_fb, table_fb = split_feedback(fb, [v_size, t_size])
 
             # Download both tables concurrently
-            values_table_coro = self.download_table(
+            values_table_coro = self._download_table(
                 category_info["values"],
                 nan_values=nan_values,
                 column_names=column_names,
                 fb=values_fb,
             )
-            lookup_table_coro = self.download_table(category_info["table"], fb=table_fb)
+            lookup_table_coro = self._download_table(
+                category_info["table"], nan_values=None, column_names=None, fb=table_fb
+            )
             values_table, lookup_table = await asyncio.gather(values_table_coro, lookup_table_coro)
 
             arrays = []
@@ -449,16 +497,20 @@ class DownloadedObject(IContext):
             """
             attribute = self._validate_typed_dict(attribute, _ATTRIBUTE_VALIDATOR)
 
+            # The attribute was validated as a whole, so its values and lookup table are downloaded without
+            # validating them again
             if "table" in attribute:
-                table = await self.download_category_table(
+                table = await self._download_category_table(
                     attribute,
                     nan_values=attribute["nan_description"]["values"] if "nan_description" in attribute else None,
+                    column_names=None,
                     fb=fb,
                 )
             else:
-                table = await self.download_table(
+                table = await self._download_table(
                     attribute["values"],
                     nan_values=attribute["nan_description"]["values"] if "nan_description" in attribute else None,
+                    column_names=None,
                     fb=fb,
                 )
             if len(table.column_names) == 1:
@@ -528,18 +580,23 @@ class DownloadedObject(IContext):
                 """
                 attribute = self._validate_typed_dict(attribute, _ATTRIBUTE_VALIDATOR)
 
+                # The attribute was validated as a whole, so its values and lookup table are downloaded without
+                # validating them again
                 if "table" in attribute:
-                    df = await self.download_category_dataframe(
+                    table = await self._download_category_table(
                         attribute,
                         nan_values=attribute["nan_description"]["values"] if "nan_description" in attribute else None,
+                        column_names=None,
                         fb=fb,
                     )
                 else:
-                    df = await self.download_dataframe(
+                    table = await self._download_table(
                         attribute["values"],
                         nan_values=attribute["nan_description"]["values"] if "nan_description" in attribute else None,
+                        column_names=None,
                         fb=fb,
                     )
+                df = table.to_pandas()
                 if len(df.columns) == 1:
                     df.columns = [attribute["name"]]
                 else:
@@ -557,5 +614,6 @@ class DownloadedObject(IContext):
 
                 :returns: A NumPy array containing the downloaded data.
                 """
+                table_info = self._validate_typed_dict(table_info, _TABLE_INFO_VALIDATOR)
                 async with self._with_parquet_loader(table_info, fb) as loader:
                     return loader.load_as_array()
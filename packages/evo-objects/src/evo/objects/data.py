@@ -12,6 +12,7 @@
 from __future__ import annotations
 
 import enum
+import functools
 import re
 from dataclasses import dataclass
 from datetime import datetime
@@ -88,6 +89,10 @@ class ObjectReference(str):
     """The version ID of the object, if specified in the URL."""
 
     def __new__(cls, value: str) -> ObjectReference:
+        if type(value) is cls:
+            # Already parsed, and references are immutable, so the same instance can be reused
+            return value
+
         inst = str.__new__(cls, value)
 
         parsed = urlparse(value)
@@ -287,18 +292,24 @@ class ObjectSchema:
 
     @classmethod
     def from_id(cls, schema_id: str) -> ObjectSchema:
-        schema_components = re.match(
-            r"/(?P<root>[-\w]+)/(?P<sub>[-\w]+)/(?P<version>\d+\.\d+\.\d+)/(?P=sub)\.schema\.json",
-            schema_id,
-        )
-        if schema_components is None:
-            raise SchemaIDFormatError(f"Could not parse schema id: '{schema_id}'")
-
-        return cls(
-            root_classification=schema_components.group("root"),
-            sub_classification=schema_components.group("sub"),
-            version=SchemaVersion.from_str(schema_components.group("version")),
-        )
+        return _parse_schema_id(cls, schema_id)
 
     def __str__(self) -> str:
         return f"/{self.classification}/{self.version}/{self.sub_classification}.schema.json"
+
+
+_SCHEMA_ID_PATTERN = re.compile(r"/(?P<root>[-\w]+)/(?P<sub>[-\w]+)/(?P<version>\d+\.\d+\.\d+)/(?P=sub)\.schema\.json")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_schema_id(cls: type[ObjectSchema], schema_id: str) -> ObjectSchema:
+    # Schemas are frozen and only a handful of schema ids are in use, so each id is parsed once and shared.
+    schema_components = _SCHEMA_ID_PATTERN.match(schema_id)
+    if schema_components is None:
+        raise SchemaIDFormatError(f"Could not parse schema id: '{schema_id}'")
+
+    return cls(
+        root_classification=schema_components.group("root"),
+        sub_classification=schema_components.group("sub"),
+        version=SchemaVersion.from_str(schema_components.group("version")),
+    )
@@ -6,12 +6,12 @@ import pandas as pd
 
 from evo.common import IFeedback
 from evo.common.interfaces import IContext
-from evo.common.utils import NoFeedback
+from evo.common.utils import NoFeedback, split_feedback
 from evo.objects.typed.attributes import Attributes
 from evo.objects.utils.table_formats import KnownTableFormat
 
 from ._model import SchemaBuilder, SchemaLocation, SchemaModel
-from ._utils import get_data_client
+from ._utils import gather_transfers, get_data_client
 from .exceptions import DataLoaderError, ObjectValidationError
 
 
@@ -30,7 +30,8 @@ class DataTable(SchemaModel):
         """
         if self._context.is_data_modified(self._data):
             raise DataLoaderError("Data was modified since the object was downloaded")
-        return await self._obj.download_dataframe(self.as_dict(), fb=fb, column_names=self.data_columns)
+        # The download only reads the table info (it is validated into a new dict), so no copy is needed
+        return await self._obj.download_dataframe(self._document, fb=fb, column_names=self.data_columns)
 
     async def from_dataframe(self, df: pd.DataFrame, fb: IFeedback = NoFeedback) -> None:
         """Update the values of this table.
@@ -91,13 +92,17 @@ class DataTableAndAttributes(SchemaModel):
         :param fb: Optional feedback object to report download progress.
         :return: DataFrame with data columns (e.g., X, Y, Z) and additional columns for attributes.
         """
-        table_df = await self._table.to_dataframe(fb=fb)
         if self.attributes is not None and len(self.attributes) > 0:
-            attr_df = await self.attributes.to_dataframe(*keys, fb=fb)
+            # The table and attributes are independent downloads, so fetch them concurrently
+            table_fb, attr_fb = split_feedback(fb, [1.0, 1.0])
+            table_df, attr_df = await gather_transfers(
+                self._table.to_dataframe(fb=table_fb),
+                self.attributes.to_dataframe(*keys, fb=attr_fb),
+            )
             combined_df = pd.concat([table_df, attr_df], axis=1)
             return combined_df
         else:
-            return table_df
+            return await self._table.to_dataframe(fb=fb)
 
     async def from_dataframe(self, df: pd.DataFrame, fb: IFeedback = NoFeedback) -> None:
         """Set the table data and attributes from a DataFrame.
@@ -121,12 +126,13 @@ class DataTableAndAttributes(SchemaModel):
     def _split_dataframe(cls, data: pd.DataFrame, data_columns: list[str]) -> tuple[pd.DataFrame, pd.DataFrame | None]:
         """Validate and split a DataFrame into table data and attribute data."""
 
-        missing = set(data_columns) - set(data.columns)
+        data_column_set = set(data_columns)
+        missing = data_column_set.difference(data.columns)
         if missing:
             raise ObjectValidationError(f"Input DataFrame must have {data_columns} columns. Missing: {missing}")
 
         table_df = data[data_columns]
-        attr_cols = [col for col in data.columns if col not in data_columns]
+        attr_cols = [col for col in data.columns if col not in data_column_set]
         attr_df = data[attr_cols] if attr_cols else None
         return table_df, attr_df
 
@@ -11,7 +11,7 @@
 
 from __future__ import annotations
 
-import copy
+import functools
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Annotated, Any, Callable, Generic, TypeVar, get_args, get_origin, get_type_hints, overload
@@ -23,12 +23,18 @@ from evo.common import IContext
 from evo.objects import DownloadedObject
 
 from ._utils import (
+    _extract_field_path,
     assign_jmespath_value,
+    clone_document,
     delete_jmespath_value,
 )
 
 _T = TypeVar("_T")
 
+# Search results are either exactly one of these proxy types or a plain scalar, so an exact type check is enough and
+# avoids the slower ABC isinstance check on every property access.
+_PROXY_TYPES = (jmespath.JMESPathArrayProxy, jmespath.JMESPathObjectProxy)
+
 
 @dataclass
 class ModelContext:
@@ -56,7 +62,7 @@ class ModelContext:
         return data_ref in self.data_modified
 
 
-@dataclass
+@dataclass(frozen=True)
 class SchemaLocation:
     """Metadata for annotating a field's location within a Geoscience Object schema."""
 
@@ -64,7 +70,7 @@ class SchemaLocation:
     """The JMESPath expression to locate this field in the document."""
 
 
-@dataclass
+@dataclass(frozen=True)
 class DataLocation:
     """Metadata for annotating a field's location within a data classes used to generate Geoscience Object data."""
 
@@ -106,6 +112,16 @@ class SchemaProperty(Generic[_T]):
     def jmespath_expr(self) -> str:
         return self._jmespath_expr
 
+    @functools.cached_property
+    def _compiled_expr(self) -> jmespath.ParsedResult:
+        """The compiled JMESPath expression, compiled on first use and reused for every get and set."""
+        return jmespath.compile(self._jmespath_expr)
+
+    @functools.cached_property
+    def _field_path(self) -> tuple[str, ...] | None:
+        """The keys of the JMESPath expression, if it is a plain dotted path of fields, otherwise None."""
+        return _extract_field_path(self._compiled_expr.parsed)
+
     def dump_value(self, value: _T) -> Any:
         """Dump a value using the TypeAdapter."""
         return self._type_adapter.dump_python(value)
@@ -120,10 +136,24 @@ class SchemaProperty(Generic[_T]):
         if instance is None:
             return self
 
-        value = instance.search(self._jmespath_expr)
+        field_path = self._field_path
+        if field_path is not None:
+            if len(field_path) == 1:
+                # Most properties are a single top-level field, which only needs one dict lookup
+                value = instance._document.get(field_path[0])
+            else:
+                # Other plain dotted paths can be read directly without evaluating the expression
+                value = instance._document
+                for key in field_path:
+                    if not isinstance(value, dict):
+                        value = None
+                        break
+                    value = value.get(key)
+        else:
+            value = self._compiled_expr.search(instance._document)
         if value is None and self._default_factory is not None:
             return self._default_factory()
-        if isinstance(value, (jmespath.JMESPathArrayProxy, jmespath.JMESPathObjectProxy)):
+        if type(value) in _PROXY_TYPES:
             value = value.raw
         # Use TypeAdapter to validate and apply defaults from Field annotations
         return self._type_adapter.validate_python(value)
@@ -150,10 +180,10 @@ def _set_property_value(schema_property: SchemaProperty, document: dict[str, Any
 
     if dumped_value is None:
         # Remove the property from the document if the value is None
-        delete_jmespath_value(document, schema_property.jmespath_expr)
+        delete_jmespath_value(document, schema_property._compiled_expr)
     else:
         # Update the document with the new value
-        assign_jmespath_value(document, schema_property.jmespath_expr, dumped_value)
+        assign_jmespath_value(document, schema_property._compiled_expr, dumped_value)
 
 
 class SchemaBuilder:
@@ -178,6 +208,27 @@ class SchemaBuilder:
             self.document.update(sub_document)
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_type_adapter(annotation: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(annotation)
+
+
+def _get_type_adapter(annotation: Any) -> TypeAdapter[Any]:
+    """Get a TypeAdapter for an annotation, reusing a previously built one where possible.
+
+    Many schema models share the same field annotations (e.g. the `name` and `description` of every object type), so
+    TypeAdapters are cached by annotation. Annotations with unhashable metadata are not cached.
+
+    :param annotation: The type annotation to build a TypeAdapter for.
+    :return: The TypeAdapter for the annotation.
+    """
+    try:
+        hash(annotation)
+    except TypeError:
+        return TypeAdapter(annotation)
+    return _cached_type_adapter(annotation)
+
+
 def _get_base_type(annotation: Any) -> tuple[Any, SchemaLocation | None, DataLocation | None]:
     """Extract the base type and SchemaLocation from an annotation.
 
@@ -252,8 +303,8 @@ class SchemaModel:
                     data_field=data_field,
                 )
             else:
-                # Create a TypeAdapter for the full annotation (preserves Field defaults)
-                type_adapter = TypeAdapter(annotation)
+                # Get a TypeAdapter for the full annotation (preserves Field defaults)
+                type_adapter = _get_type_adapter(annotation)
 
                 # Create SchemaProperty descriptor and set it on the class
                 prop = SchemaProperty(
@@ -373,7 +424,7 @@ class SchemaModel:
 
         :return: The model as a dictionary.
         """
-        return copy.deepcopy(self._document)
+        return clone_document(self._document)
 
 
 _M = TypeVar("_M", bound=SchemaModel)
@@ -9,9 +9,13 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
+import copy
+import inspect
 import uuid
+from collections.abc import Coroutine
 from logging import getLogger
-from typing import Any
+from typing import Any, TypeVar
 
 from evo import jmespath
 from evo.common import APIConnector, Environment, ICache, IContext
@@ -23,6 +27,11 @@ from evo.objects.utils import ObjectDataClient
 
 logger = getLogger(__name__)
 
+_T = TypeVar("_T")
+
+_MAX_CONCURRENT_TRANSFERS = 8
+"""The default maximum number of data uploads or downloads that a typed object runs at the same time."""
+
 
 def _extract_field_name(node: Any) -> str | None:
     if node["type"] == "field":
@@ -30,6 +39,22 @@ def _extract_field_name(node: Any) -> str | None:
     return None
 
 
+def _extract_field_path(node: Any) -> tuple[str, ...] | None:
+    """Extract the keys of a plain dotted path like `a.b.c`, or None if the expression is anything more complex."""
+    field_name = _extract_field_name(node)
+    if field_name:
+        return (field_name,)
+    if node["type"] != "subexpression":
+        return None
+    path: tuple[str, ...] = ()
+    for child in node["children"]:
+        child_path = _extract_field_path(child)
+        if child_path is None:
+            return None
+        path += child_path
+    return path
+
+
 def assign_jmespath_value(document: dict[str, Any], path: jmespath.ParsedResult | str, value: Any) -> None:
     """Assign a value to a location in a document specified by a JMESPath expression.
 
@@ -86,6 +111,30 @@ def delete_jmespath_value(document: dict[str, Any], path: jmespath.ParsedResult
     document.pop(last_field_name, None)
 
 
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, type(None), uuid.UUID})
+
+
+def clone_document(value: Any) -> Any:
+    """Make a deep copy of a JSON-like document.
+
+    Documents are trees of dicts, lists and immutable scalars, so they can be copied much faster than with
+    `copy.deepcopy`, which has to dispatch on every value and track shared references. Any other mutable value is still
+    copied with `copy.deepcopy`.
+
+    :param value: The document, or part of a document, to copy.
+    :return: The copied document.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {key: clone_document(item) for key, item in value.items()}
+    elif value_type is list:
+        return [clone_document(item) for item in value]
+    elif value_type in _IMMUTABLE_TYPES:
+        return value
+    else:
+        return copy.deepcopy(value)
+
+
 def get_data_client(context: IContext) -> ObjectDataClient:
     """Get an ObjectDataClient for the current context."""
     connector = context.get_connector()
@@ -94,6 +143,38 @@ def get_data_client(context: IContext) -> ObjectDataClient:
     return ObjectDataClient(connector=connector, environment=environment, cache=cache)
 
 
+async def gather_transfers(
+    *coros: Coroutine[Any, Any, _T], max_concurrency: int = _MAX_CONCURRENT_TRANSFERS
+) -> list[_T]:
+    """Run data transfers concurrently, with at most `max_concurrency` of them in progress at once.
+
+    If any transfer fails, the transfers that are still pending are cancelled before the error is raised, so none are
+    left running in the background.
+
+    :param coros: The transfer coroutines to run.
+    :param max_concurrency: The maximum number of transfers to run at the same time.
+
+    :return: The results of the transfers, in the same order as the coroutines.
+    """
+    semaphore = asyncio.BoundedSemaphore(max_concurrency)
+
+    async def _run(coro: Coroutine[Any, Any, _T]) -> _T:
+        async with semaphore:
+            return await coro
+
+    tasks = [asyncio.create_task(_run(coro)) for coro in coros]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        for coro in coros:
+            # Close transfers that were cancelled before they started, so they are not reported as never awaited
+            if inspect.getcoroutinestate(coro) == inspect.CORO_CREATED:
+                coro.close()
+
+
 def _response_to_downloaded_object(
     response: models.PostObjectResponse, environment: Environment, connector: APIConnector, cache: ICache | None
 ) -> DownloadedObject:
@@ -125,10 +206,11 @@ async def create_geoscience_object(
         name = object_dict["name"]
 
         if parent is None:
-            parent = ""
-        elif not parent.endswith("/"):
-            parent += "/"
-        path = parent + name + ".json"
+            path = f"{name}.json"
+        elif parent.endswith("/"):
+            path = f"{parent}{name}.json"
+        else:
+            path = f"{parent}/{name}.json"
     object_for_upload = models.GeoscienceObject.model_validate(object_dict)
     response = await objects_api.post_objects(
         org_id=str(environment.org_id),
@@ -19,7 +19,7 @@ import pandas as pd
 
 from evo import jmespath
 from evo.common import IContext, IFeedback
-from evo.common.utils import NoFeedback, iter_with_fb
+from evo.common.utils import NoFeedback, split_feedback
 from evo.objects import DownloadedObject
 from evo.objects.utils.table_formats import (
     BOOL_ARRAY_1,
@@ -30,7 +30,7 @@ from evo.objects.utils.table_formats import (
 )
 
 from ._model import SchemaList, SchemaLocation, SchemaModel
-from ._utils import get_data_client
+from ._utils import gather_transfers, get_data_client
 from .exceptions import DataLoaderError, ObjectValidationError
 
 if TYPE_CHECKING:
@@ -49,6 +49,14 @@ class UnSupportedDataTypeError(Exception):
     """An unsupported data type was encountered while processing data."""
 
 
+_attribute_types_by_dtype_kind = {
+    "i": "integer",
+    "u": "integer",
+    "f": "scalar",
+    "b": "bool",
+}
+
+
 def _infer_attribute_type_from_series(series: pd.Series) -> str:
     """Infer the attribute type from a Pandas Series.
 
@@ -56,27 +64,31 @@ def _infer_attribute_type_from_series(series: pd.Series) -> str:
 
     :return: The inferred attribute type.
     """
-    if pd.api.types.is_integer_dtype(series):
-        return "integer"
-    elif pd.api.types.is_float_dtype(series):
-        return "scalar"
-    elif pd.api.types.is_bool_dtype(series):
-        return "bool"
-    elif isinstance(series.dtype, pd.CategoricalDtype):
+    # Dispatch on the dtype kind, which numpy and pandas extension dtypes both provide, rather than going through
+    # the pandas is_*_dtype helpers for every column.
+    dtype = series.dtype
+    kind = dtype.kind
+    attribute_type = _attribute_types_by_dtype_kind.get(kind)
+    if attribute_type is not None:
+        return attribute_type
+    elif isinstance(dtype, pd.CategoricalDtype):
         return "category"
-    elif pd.api.types.is_string_dtype(series):
+    elif kind in "OSU" and pd.api.types.is_string_dtype(series):
+        # Object columns need the values inspected to confirm they hold strings
         return "string"
     else:
         raise UnSupportedDataTypeError(f"Unsupported dtype for attribute: {series.dtype}")
 
 
 _attribute_table_formats = {
-    "scalar": [FLOAT_ARRAY_1],
-    "integer": [INTEGER_ARRAY_1_INT32, INTEGER_ARRAY_1_INT64],
-    "bool": [BOOL_ARRAY_1],
-    "string": [STRING_ARRAY],
+    "scalar": (FLOAT_ARRAY_1,),
+    "integer": (INTEGER_ARRAY_1_INT32, INTEGER_ARRAY_1_INT64),
+    "bool": (BOOL_ARRAY_1,),
+    "string": (STRING_ARRAY,),
 }
 
+_attribute_types_with_nan_description = frozenset({"scalar", "integer", "category"})
+
 
 class Attribute(SchemaModel):
     """A Geoscience Object Attribute"""
@@ -110,7 +122,8 @@ class Attribute(SchemaModel):
         """
         if self._context.is_data_modified(self._data):
             raise DataLoaderError("Data was modified since the object was downloaded")
-        return await self._obj.download_attribute_dataframe(self.as_dict(), fb=fb)
+        # The download only reads the attribute (it is validated into a new dict), so no copy is needed
+        return await self._obj.download_attribute_dataframe(self._document, fb=fb)
 
     async def set_attribute_values(
         self, df: pd.DataFrame, infer_attribute_type: bool = False, fb: IFeedback = NoFeedback
@@ -149,7 +162,7 @@ class Attribute(SchemaModel):
             table_formats = _attribute_table_formats.get(attribute_type)
             attr_doc["values"] = await data_client.upload_dataframe(df, table_format=table_formats, fb=fb)
 
-        if attribute_type in ["scalar", "integer", "category"]:
+        if attribute_type in _attribute_types_with_nan_description:
             attr_doc["nan_description"] = {"values": []}
 
 
@@ -169,11 +182,27 @@ class Attributes(SchemaList[Attribute]):
         :raises IndexError: If the integer index is out of range.
         """
         if isinstance(index_or_name, str):
-            for attr in self:
-                if attr.name == index_or_name or attr.key == index_or_name:
-                    return attr
+            # Scan the raw attribute documents, so only the matching attribute gets an Attribute wrapper
+            for index, attr_doc in enumerate(self._document):
+                if attr_doc.get("name") == index_or_name or attr_doc.get("key") == index_or_name:
+                    return super().__getitem__(index)
         return super().__getitem__(index_or_name)
 
+    def _index_by_name_or_key(self) -> dict[str, int]:
+        """Build a lookup from attribute name and key to the index of the first matching attribute.
+
+        This is only worth building when looking up several attributes at once. It reads the raw attribute documents,
+        so no Attribute wrappers are constructed.
+        """
+        lookup: dict[str, int] = {}
+        # Iterate in reverse so that earlier attributes take precedence
+        for index in range(len(self._document) - 1, -1, -1):
+            attr_doc = self._document[index]
+            lookup[attr_doc.get("name")] = index
+            if key := attr_doc.get("key"):
+                lookup[key] = index
+        return lookup
+
     @classmethod
     async def _data_to_schema(
         cls,
@@ -210,20 +239,27 @@ class Attributes(SchemaList[Attribute]):
         """
         data_client = get_data_client(context)
 
-        for col in df.columns:
-            series = df[col]
-            attribute_type = _infer_attribute_type_from_series(series)
-
-            attr_doc: dict[str, Any] = {
+        # Infer all types up front, so an unsupported column fails before anything is uploaded
+        attribute_types = [_infer_attribute_type_from_series(df[col]) for col in df.columns]
+        attr_docs: list[dict[str, Any]] = [
+            {
                 "name": str(col),
                 "key": str(uuid.uuid4()),
                 "attribute_type": attribute_type,
             }
+            for col, attribute_type in zip(df.columns, attribute_types)
+        ]
+
+        # Each column is uploaded independently, so upload them concurrently
+        fb_parts = split_feedback(fb, [1.0] * len(attr_docs))
+        await gather_transfers(
+            *(
+                Attribute._upload_attribute_values(attr_doc, df[col].to_frame(), attribute_type, data_client, fb_part)
+                for attr_doc, col, attribute_type, fb_part in zip(attr_docs, df.columns, attribute_types, fb_parts)
+            )
+        )
 
-            col_df = df[[col]]
-            await Attribute._upload_attribute_values(attr_doc, col_df, attribute_type, data_client)
-
-            attributes_list.append(attr_doc)
+        attributes_list.extend(attr_docs)
 
     async def to_dataframe(self, *keys: str, fb: IFeedback = NoFeedback) -> pd.DataFrame:
         """Load a DataFrame containing the values from the specified attributes in the object.
@@ -235,8 +271,16 @@ class Attributes(SchemaList[Attribute]):
         :return: A DataFrame containing the values from the specified attributes. Column name(s) will be updated
             based on the attribute names.
         """
-        attributes = [self[key] for key in keys] if keys else list(self)
-        parts = [await attribute.to_dataframe(fb=fb_part) for attribute, fb_part in iter_with_fb(attributes, fb)]
+        if keys:
+            lookup = self._index_by_name_or_key()
+            attributes = [self[lookup.get(key, key)] for key in keys]
+        else:
+            attributes = list(self)
+        # Each attribute is downloaded independently, so download them concurrently
+        fb_parts = split_feedback(fb, [1.0] * len(attributes))
+        parts = await gather_transfers(
+            *(attribute.to_dataframe(fb=fb_part) for attribute, fb_part in zip(attributes, fb_parts))
+        )
         return pd.concat(parts, axis=1) if len(parts) > 0 else pd.DataFrame()
 
     async def append_attribute(self, df: pd.DataFrame, fb: IFeedback = NoFeedback):
@@ -264,9 +308,12 @@ class Attributes(SchemaList[Attribute]):
         :param df: DataFrame containing the values for the new attributes.
         :param fb: Optional feedback object to report upload progress.
         """
-        for attribute in df.columns:
-            attribute_df = df[[attribute]]
-            await self.append_attribute(attribute_df, fb)
+        start = len(self._document)
+        await self._upload_attributes_to_list(self._document, df, self._obj, fb)
+
+        # Mark context as modified for each new attribute
+        for index in range(start, len(self._document)):
+            self._context.mark_modified(self[index]._data)
 
     async def set_attributes(self, df: pd.DataFrame, fb: IFeedback = NoFeedback):
         """Set the attributes of the object to match the provided DataFrame.
@@ -278,11 +325,13 @@ class Attributes(SchemaList[Attribute]):
         attributes_by_name = {attr.name: attr for attr in self}
         self.clear()
         for col in df.columns:
-            attribute_df = df[[col]]
+            attribute_df = df[col].to_frame()
             attribute = attributes_by_name.get(col)
             if attribute is not None:
                 await attribute.set_attribute_values(attribute_df, fb=fb)
-                self._append(attribute)
+                # The attribute wraps a dict that was removed from this list by clear(), so it can be put back
+                # as-is rather than appending a deep copy of it.
+                self._document.append(attribute._document)
             else:
                 await self.append_attribute(attribute_df, fb=fb)
 
@@ -293,7 +342,8 @@ class Attributes(SchemaList[Attribute]):
         :raises ObjectValidationError: If any attribute has a different length.
         """
         for attribute in self:
-            attribute_length = jmespath.search("values.length", attribute.as_dict())
+            # Only reading the document here, so there is no need for the deep copy that as_dict() makes
+            attribute_length = jmespath.search("values.length", attribute._document)
             if attribute_length is None:
                 raise ObjectValidationError(f"Can't determine length of attribute '{attribute.name}'")
             if attribute_length != expected_length:
@@ -420,6 +470,10 @@ class BlockModelAttributes:
                 obj=block_model,
             )
             self._attributes.append(attr_with_obj)
+        # The collection is immutable, so index names once for lookups (the first attribute with a name wins)
+        self._attributes_by_name: dict[str, BlockModelAttribute] = {}
+        for attr in self._attributes:
+            self._attributes_by_name.setdefault(attr.name, attr)
 
     @classmethod
     def from_schema(cls, attributes_list: list[dict], block_model: BlockModel | None = None) -> BlockModelAttributes:
@@ -458,9 +512,9 @@ class BlockModelAttributes:
 
     def __getitem__(self, index_or_name: int | str) -> BlockModelAttribute | BlockModelPendingAttribute:
         if isinstance(index_or_name, str):
-            for attr in self._attributes:
-                if attr.name == index_or_name:
-                    return attr
+            attr = self._attributes_by_name.get(index_or_name)
+            if attr is not None:
+                return attr
             # Return a BlockModelPendingAttribute for non-existent attributes accessed by name
             # Pass the block model directly as _obj
             return BlockModelPendingAttribute(self._block_model, index_or_name)
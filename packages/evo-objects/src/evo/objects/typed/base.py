@@ -11,7 +11,6 @@
 
 from __future__ import annotations
 
-import copy
 import sys
 import weakref
 from dataclasses import dataclass
@@ -24,6 +23,7 @@ from evo.objects import DownloadedObject, ObjectMetadata, ObjectReference, Objec
 
 from ._model import ModelContext, SchemaLocation, SchemaModel
 from ._utils import (
+    clone_document,
     create_geoscience_object,
     replace_geoscience_object,
 )
@@ -372,7 +372,7 @@ class _BaseObject(SchemaModel):
 
         :return: The Geoscience Object as a dictionary.
         """
-        return copy.deepcopy(self._document)
+        return clone_document(self._document)
 
     async def refresh(self) -> Self:
         """Refresh this object with the latest data from the server.
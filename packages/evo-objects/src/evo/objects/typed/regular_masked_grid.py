@@ -20,13 +20,13 @@ import pandas as pd
 import pyarrow as pa
 
 from evo.common import IContext, IFeedback
-from evo.common.utils import NoFeedback
+from evo.common.utils import NoFeedback, split_feedback
 from evo.objects import SchemaVersion
 from evo.objects.utils.table_formats import BOOL_ARRAY_1
 
 from ._grid import BaseRegular3DGrid, BaseRegular3DGridData
 from ._model import DataLocation, SchemaLocation, SchemaModel
-from ._utils import assign_jmespath_value, get_data_client
+from ._utils import assign_jmespath_value, gather_transfers, get_data_client
 from .attributes import Attributes
 from .exceptions import DataLoaderError, ObjectValidationError
 from .types import Size3i
@@ -117,21 +117,25 @@ class MaskedCells(SchemaModel):
                 f"The number of rows in the dataframe ({df.shape[0]}) does not match the number of valid cells in the grid ({number_active})."
             )
 
-        self.number_active = number_active
+        if mask is None:
+            await self.attributes.set_attributes(df, fb=fb)
+            return
 
-        if mask is not None:
-            # Upload the mask
-            data_client = get_data_client(self._obj)
-            table_info = await data_client.upload_table(
-                table=pa.table({"mask": pa.array(mask)}),
-                table_format=BOOL_ARRAY_1,
-                fb=fb,
-            )
-            assign_jmespath_value(self._document, "mask.values", table_info)
-            # Mark mask data as modified
-            self._context.mark_modified("mask.values.data")
+        # set_attributes rewrites the attribute list as it uploads, so the mask is uploaded first. That way a failed
+        # mask upload leaves the attributes untouched.
+        mask_fb, attributes_fb = split_feedback(fb, [mask.shape[0], df.size])
+        data_client = get_data_client(self._obj)
+        table_info = await data_client.upload_table(
+            table=pa.table({"mask": pa.array(mask)}),
+            table_format=BOOL_ARRAY_1,
+            fb=mask_fb,
+        )
+        await self.attributes.set_attributes(df, fb=attributes_fb)
 
-        await self.attributes.set_attributes(df, fb=fb)
+        self.number_active = number_active
+        assign_jmespath_value(self._document, "mask.values", table_info)
+        # Mark mask data as modified
+        self._context.mark_modified("mask.values.data")
 
     def validate(self) -> None:
         """Validate that all attributes have the correct length and mask is valid."""
@@ -144,13 +148,16 @@ class MaskedCells(SchemaModel):
     @classmethod
     async def _data_to_schema(cls, data: Any, context: IContext) -> dict[str, Any]:
         """Convert data to a dictionary for schema creation."""
-        result = await super()._data_to_schema(data, context)
-
         mask = data.mask
         data_client = get_data_client(context)
-        table_info = await data_client.upload_table(
-            table=pa.table({"mask": pa.array(mask)}),
-            table_format=BOOL_ARRAY_1,
+        # Upload the mask alongside the cell attributes rather than after them. If either upload fails, the other is
+        # cancelled rather than left running.
+        result, table_info = await gather_transfers(
+            super()._data_to_schema(data, context),
+            data_client.upload_table(
+                table=pa.table({"mask": pa.array(mask)}),
+                table_format=BOOL_ARRAY_1,
+            ),
         )
         result["mask"] = {
             "name": "mask",
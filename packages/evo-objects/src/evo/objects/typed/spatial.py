@@ -69,8 +69,16 @@ class BaseSpatialObject(BaseObject):
     # The bounding box is defined as regular a property so that subclasses can override it if needed
     @property
     def bounding_box(self) -> BoundingBox:
-        return self._bounding_box
+        # BoundingBox is immutable, so reuse the last validated value while the document holds the same dict
+        source = self._document.get("bounding_box")
+        cached = self.__dict__.get("_bounding_box_cache")
+        if cached is not None and cached[0] is source:
+            return cached[1]
+        bounding_box = self._bounding_box
+        self._bounding_box_cache = (source, bounding_box)
+        return bounding_box
 
     @bounding_box.setter
     def bounding_box(self, value: BoundingBox) -> None:
         self._bounding_box = value
+        self.__dict__.pop("_bounding_box_cache", None)
@@ -11,6 +11,7 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from typing import Annotated, Any, overload
 
@@ -288,6 +289,24 @@ class EllipsoidRanges:
         )
 
 
+@functools.lru_cache(maxsize=8)
+def _unit_sphere_points(n_points: int) -> npt.NDArray[np.floating[Any]]:
+    """Get the (3, n_points * n_points) unit sphere surface grid used by `Ellipsoid.surface_points`.
+
+    The result is cached and read-only, as it only depends on the number of points.
+    """
+    u = np.linspace(0, 2 * np.pi, n_points)
+    v = np.linspace(0, np.pi, n_points)
+    sin_v = np.sin(v)[:, np.newaxis]
+    points = np.empty((3, n_points, n_points))
+    points[0] = np.cos(u) * sin_v
+    points[1] = np.sin(u) * sin_v
+    points[2] = np.cos(v)[:, np.newaxis]
+    points = points.reshape(3, -1)
+    points.setflags(write=False)
+    return points
+
+
 @dataclass
 class Ellipsoid:
     """An ellipsoid defining a spatial region."""
@@ -331,20 +350,37 @@ class Ellipsoid:
     ) -> tuple[npt.NDArray[np.floating[Any]], npt.NDArray[np.floating[Any]], npt.NDArray[np.floating[Any]]]:
         """Generate surface mesh points for 3D visualization."""
         rot_matrix = self.rotation.as_rotation_matrix()
+        # Leapfrog convention: major=X, semi_major=Y, minor=Z. Scaling the columns of the rotation matrix applies the
+        # ranges and the rotation to the cached unit sphere in a single matrix product.
+        transform = rot_matrix * np.array([self.ranges.major, self.ranges.semi_major, self.ranges.minor])
+        rotated = transform @ _unit_sphere_points(n_points)
+        rotated += np.asarray(center, dtype=float)[:, np.newaxis]
 
-        u = np.linspace(0, 2 * np.pi, n_points)
-        v = np.linspace(0, np.pi, n_points)
-        u, v = np.meshgrid(u, v)
+        return rotated[0], rotated[1], rotated[2]
 
-        # Leapfrog convention: major=X, semi_major=Y, minor=Z
-        x = self.ranges.major * np.cos(u) * np.sin(v)  # major along X
-        y = self.ranges.semi_major * np.sin(u) * np.sin(v)  # semi_major along Y
-        z = self.ranges.minor * np.cos(v)  # minor along Z
+    @staticmethod
+    def surface_triangles(
+        n_points: int = 20,
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+        """Generate triangle vertex indices for the mesh produced by `surface_points`.
 
-        points = np.array([x.flatten(), y.flatten(), z.flatten()])
-        rotated = rot_matrix @ points
+        The indices describe two triangles per quad of the `n_points` x `n_points` parameter grid, so the surface
+        can be rendered directly (e.g. as the `i`, `j`, `k` arguments of a Plotly `Mesh3d`) without computing a
+        convex hull.
 
-        return rotated[0] + center[0], rotated[1] + center[1], rotated[2] + center[2]
+        :param n_points: The number of points along each parameter axis, matching `surface_points`.
+        :return: Three arrays containing the first, second, and third vertex index of each triangle.
+        """
+        # Index of the lower-left corner of each quad in the flattened (v, u) grid
+        corner = (np.arange(n_points - 1)[:, np.newaxis] * n_points + np.arange(n_points - 1)).ravel()
+        right = corner + 1
+        up = corner + n_points
+        diagonal = up + 1
+        return (
+            np.concatenate([corner, corner]),
+            np.concatenate([right, diagonal]),
+            np.concatenate([diagonal, up]),
+        )
 
     def wireframe_points(
         self,
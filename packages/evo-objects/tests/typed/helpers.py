@@ -22,6 +22,11 @@ import pandas as pd
 from evo.common import APIConnector, Environment, ICache, IContext
 from evo.objects import DownloadedObject, ObjectReference, ObjectSchema
 
+EXPECTED_ELLIPSOID_DICT = {
+    "ellipsoid_ranges": {"major": 100, "semi_major": 50, "minor": 25},
+    "rotation": {"dip_azimuth": 45, "dip": 30, "pitch": 0},
+}
+
 
 class MockDownloadedObject(DownloadedObject):
     def __init__(self, mock_client: MockClient, object_dict: dict, version_id: str = "1"):
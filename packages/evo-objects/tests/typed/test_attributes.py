@@ -31,6 +31,9 @@ class TestAttributeTypeInference(TestCase):
             ("bool", pd.Series([True, False, True], dtype="bool"), "bool"),
             ("string", pd.Series(["a", "b", "c"], dtype="string"), "string"),
             ("category", pd.Categorical(["a", "b", "a"]), "category"),
+            ("nullable_integer", pd.Series([1, None, 3], dtype="Int64"), "integer"),
+            ("nullable_bool", pd.Series([True, None, False], dtype="boolean"), "bool"),
+            ("object_string", pd.Series(["a", "b", "c"], dtype="object"), "string"),
         ]
     )
     def test_infer_attribute_type(self, _name, series, expected_type):
@@ -46,3 +49,9 @@ class TestAttributeTypeInference(TestCase):
         series = pd.Series([1 + 2j, 3 + 4j], dtype="complex128")
         with self.assertRaises(UnSupportedDataTypeError):
             _infer_attribute_type_from_series(series)
+
+    def test_unsupported_object_dtype(self):
+        """Test that object columns that do not hold strings raise an error."""
+        series = pd.Series([{"a": 1}, {"b": 2}], dtype="object")
+        with self.assertRaises(UnSupportedDataTypeError):
+            _infer_attribute_type_from_series(series)
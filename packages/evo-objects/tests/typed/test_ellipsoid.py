@@ -12,6 +12,7 @@
 """Tests for ellipsoid and variogram data generation functions."""
 
 import unittest
+from types import SimpleNamespace
 
 import numpy as np
 from parameterized import parameterized
@@ -26,22 +27,27 @@ from evo.objects.typed.variogram import (
     _evaluate_structure,
 )
 
+from .helpers import EXPECTED_ELLIPSOID_DICT
+
 
 class TestEllipsoidWireframe(unittest.TestCase):
     """Tests for ellipsoid wireframe generation."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # The ellipsoid is only read by these tests, so one instance is shared across the class
+        cls.ellipsoid = Ellipsoid(ranges=EllipsoidRanges(100, 50, 25))
+
     def test_wireframe_shape(self):
         """Wireframe should return coordinate arrays of same length."""
-        ell = Ellipsoid(ranges=EllipsoidRanges(100, 50, 25))
-        x, y, z = ell.wireframe_points(n_points=20)
+        x, y, z = self.ellipsoid.wireframe_points(n_points=20)
         self.assertEqual(len(x), len(y))
         self.assertEqual(len(y), len(z))
         self.assertGreater(len(x), 0)
 
     def test_wireframe_bounds(self):
         """Wireframe points should be within ellipsoid bounds."""
-        ell = Ellipsoid(ranges=EllipsoidRanges(100, 50, 25))
-        x, y, z = ell.wireframe_points(n_points=30)
+        x, y, z = self.ellipsoid.wireframe_points(n_points=30)
 
         # Filter out NaN separators
         valid = ~np.isnan(x)
@@ -51,8 +57,7 @@ class TestEllipsoidWireframe(unittest.TestCase):
 
     def test_wireframe_has_nan_separators(self):
         """Wireframe should have NaN values separating line segments."""
-        ell = Ellipsoid(ranges=EllipsoidRanges(100, 50, 25))
-        x, y, z = ell.wireframe_points()
+        x, y, z = self.ellipsoid.wireframe_points()
         self.assertTrue(np.any(np.isnan(x)))
 
     def test_wireframe_with_rotation(self):
@@ -68,10 +73,14 @@ class TestEllipsoidWireframe(unittest.TestCase):
 class TestEllipsoidSurface(unittest.TestCase):
     """Tests for ellipsoid surface mesh generation."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # The ellipsoid is only read by these tests, so one instance is shared across the class
+        cls.ellipsoid = Ellipsoid(ranges=EllipsoidRanges(100, 50, 25))
+
     def test_surface_shape(self):
         """Surface should return flattened 1D arrays."""
-        ell = Ellipsoid(ranges=EllipsoidRanges(100, 50, 25))
-        x, y, z = ell.surface_points(n_points=15)
+        x, y, z = self.ellipsoid.surface_points(n_points=15)
         self.assertEqual(x.ndim, 1)
         self.assertEqual(y.ndim, 1)
         self.assertEqual(z.ndim, 1)
@@ -79,12 +88,31 @@ class TestEllipsoidSurface(unittest.TestCase):
 
     def test_surface_bounds(self):
         """Surface points should be within ellipsoid bounds."""
-        ell = Ellipsoid(ranges=EllipsoidRanges(100, 50, 25))
-        x, y, z = ell.surface_points()
+        x, y, z = self.ellipsoid.surface_points()
         self.assertTrue(np.all(np.abs(x) <= 100 * 1.01))
         self.assertTrue(np.all(np.abs(y) <= 50 * 1.01))
         self.assertTrue(np.all(np.abs(z) <= 25 * 1.01))
 
+    def test_surface_points_on_ellipsoid(self):
+        """Surface points should lie on the ellipsoid, including on repeated calls that reuse the unit sphere."""
+        for ranges in (EllipsoidRanges(100, 50, 25), EllipsoidRanges(10, 20, 30)):
+            ell = Ellipsoid(ranges=ranges)
+            x, y, z = ell.surface_points(center=(1, 2, 3), n_points=15)
+            radius = ((x - 1) / ranges.major) ** 2 + ((y - 2) / ranges.semi_major) ** 2 + ((z - 3) / ranges.minor) ** 2
+            np.testing.assert_allclose(radius, 1.0)
+
+    def test_surface_triangles(self):
+        """Surface triangles should index into the surface points with two triangles per grid quad."""
+        i, j, k = Ellipsoid.surface_triangles(n_points=15)
+        self.assertEqual(len(i), 2 * 14 * 14)
+        self.assertEqual(len(j), len(i))
+        self.assertEqual(len(k), len(i))
+        faces = np.stack([i, j, k])
+        self.assertEqual(faces.min(), 0)
+        self.assertEqual(faces.max(), 15 * 15 - 1)
+        # Every triangle references three distinct vertices
+        self.assertTrue(np.all((i != j) & (j != k) & (i != k)))
+
 
 class TestEvaluateStructure(unittest.TestCase):
     """Tests for variogram structure evaluation."""
@@ -141,14 +169,11 @@ class TestVariogramMethods(unittest.TestCase):
     """Tests for Variogram class methods like get_ellipsoid, get_principal_directions, get_direction."""
 
     def _create_mock_variogram(self, structures):
-        """Create a mock variogram object with given structure dicts."""
-        from unittest.mock import MagicMock
+        """Create a stand-in variogram object with given structure dicts.
 
-        variogram = MagicMock()
-        variogram.structures = structures
-        variogram.nugget = 0.1
-        variogram.sill = 1.0
-        return variogram
+        The Variogram methods under test only read plain attributes, so a SimpleNamespace is enough.
+        """
+        return SimpleNamespace(structures=structures, nugget=0.1, sill=1.0)
 
     def test_get_ellipsoid_default_selects_largest_volume(self):
         """get_ellipsoid() with no args should select structure with largest volume."""
@@ -612,10 +637,7 @@ class TestEllipsoidClass(unittest.TestCase):
             ranges=EllipsoidRanges(100, 50, 25),
             rotation=Rotation(45, 30, 0),
         )
-        d = ell.to_dict()
-
-        self.assertEqual(d["ellipsoid_ranges"]["major"], 100)
-        self.assertEqual(d["rotation"]["dip_azimuth"], 45)
+        self.assertEqual(ell.to_dict(), EXPECTED_ELLIPSOID_DICT)
 
 
 class TestEllipsoidWireframeAxisAlignment(unittest.TestCase):
@@ -14,7 +14,7 @@ from __future__ import annotations
 import contextlib
 import dataclasses
 import uuid
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import numpy as np
 import pandas as pd
@@ -163,6 +163,25 @@ class TestRegularMaskedGrid(TestWithConnector):
                 ),
             )
 
+    async def test_update_with_failed_mask_upload(self):
+        with self._mock_geoscience_objects() as mock_client:
+            obj = await RegularMasked3DGrid.create(context=self.context, data=self.example_grid)
+            original_attributes = [attribute.as_dict() for attribute in obj.cells.attributes]
+            original_mask = obj.as_dict()["mask"]
+            original_active_count = obj.cells.number_active
+
+            new_mask = np.array([True, True, False, False, True] * 100, dtype=bool)
+            mock_client.upload_table = AsyncMock(side_effect=RuntimeError("Mask upload failed"))
+            with self.assertRaises(RuntimeError):
+                await obj.cells.from_dataframe(
+                    pd.DataFrame({"value": np.ones(np.sum(new_mask))}),
+                    mask=new_mask,
+                )
+
+            self.assertEqual([attribute.as_dict() for attribute in obj.cells.attributes], original_attributes)
+            self.assertEqual(obj.as_dict()["mask"], original_mask)
+            self.assertEqual(obj.cells.number_active, original_active_count)
+
     async def test_update_without_new_mask(self):
         with self._mock_geoscience_objects():
             obj = await RegularMasked3DGrid.create(context=self.context, data=self.example_grid)
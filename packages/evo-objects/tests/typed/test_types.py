@@ -30,6 +30,8 @@ from evo.objects.typed import (
     Size3i,
 )
 
+from .helpers import EXPECTED_ELLIPSOID_DICT
+
 
 class TestTypes(TestCase):
     @parameterized.expand(
@@ -205,9 +207,7 @@ class TestEllipsoid(TestCase):
             ranges=EllipsoidRanges(100, 50, 25),
             rotation=Rotation(45, 30, 0),
         )
-        d = ell.to_dict()
-        self.assertEqual(d["ellipsoid_ranges"]["major"], 100)
-        self.assertEqual(d["rotation"]["dip_azimuth"], 45)
+        self.assertEqual(ell.to_dict(), EXPECTED_ELLIPSOID_DICT)
 
     def test_surface_points(self):
         """Should generate surface points as 1D arrays."""
@@ -11,17 +11,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+from unittest import IsolatedAsyncioTestCase, TestCase
 
 from parameterized import parameterized
 
 from data import load_test_data
+from evo import jmespath
 from evo.common import Environment, StaticContext
 from evo.common.data import RequestMethod
 from evo.common.test_tools import BASE_URL, ORG, WORKSPACE_ID, TestWithConnector
 from evo.common.utils.version import get_header_metadata
 from evo.objects.client.api_client import ObjectAPIClient
-from evo.objects.typed._utils import create_geoscience_object
+from evo.objects.typed._utils import _extract_field_path, clone_document, create_geoscience_object, gather_transfers
 
 
 class TestCreateGeoscienceObject(TestWithConnector):
@@ -100,3 +103,81 @@ class TestCreateGeoscienceObject(TestWithConnector):
         }
         with self.assertRaises(ValueError):
             await create_geoscience_object(self.context, new_pointset, parent=parent, path=path)
+
+
+class TestExtractFieldPath(TestCase):
+    @parameterized.expand(
+        [
+            ("field", "name", ("name",)),
+            ("dotted", "bounding_box.min_x", ("bounding_box", "min_x")),
+            ("nested", "locations.coordinates.data", ("locations", "coordinates", "data")),
+            ("index", "attributes[0]", None),
+            ("filter", "attributes[?name == 'a']", None),
+        ]
+    )
+    def test_extract_field_path(self, _name: str, expression: str, expected: tuple[str, ...] | None) -> None:
+        self.assertEqual(expected, _extract_field_path(jmespath.compile(expression).parsed))
+
+
+class TestCloneDocument(TestCase):
+    def test_clone_document(self):
+        document = {
+            "name": "Sample pointset",
+            "uuid": None,
+            "bounding_box": {"min_x": 0.0, "max_x": 1.0},
+            "attributes": [{"name": "a", "values": {"length": 1, "data": "abc"}, "nan_description": {"values": []}}],
+            "flag": True,
+        }
+        cloned = clone_document(document)
+        self.assertEqual(cloned, document)
+
+        cloned["bounding_box"]["min_x"] = 5.0
+        cloned["attributes"][0]["nan_description"]["values"].append(-1)
+        cloned["attributes"].append({})
+        self.assertEqual(document["bounding_box"]["min_x"], 0.0)
+        self.assertEqual(document["attributes"][0]["nan_description"]["values"], [])
+        self.assertEqual(len(document["attributes"]), 1)
+
+    def test_clone_document_copies_other_mutable_values(self):
+        document = {"values": {1, 2}}
+        cloned = clone_document(document)
+        self.assertEqual(cloned, document)
+        self.assertIsNot(cloned["values"], document["values"])
+
+
+class TestGatherTransfers(IsolatedAsyncioTestCase):
+    async def test_limits_concurrency(self):
+        in_progress = 0
+        max_in_progress = 0
+
+        async def transfer(i: int) -> int:
+            nonlocal in_progress, max_in_progress
+            in_progress += 1
+            max_in_progress = max(max_in_progress, in_progress)
+            await asyncio.sleep(0)
+            in_progress -= 1
+            return i
+
+        results = await gather_transfers(*(transfer(i) for i in range(10)), max_concurrency=3)
+        self.assertEqual(results, list(range(10)))
+        self.assertEqual(max_in_progress, 3)
+
+    async def test_cancels_pending_transfers_on_failure(self):
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def slow_transfer() -> None:
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def failing_transfer() -> None:
+            await started.wait()
+            raise ValueError("Upload failed")
+
+        with self.assertRaises(ValueError):
+            await gather_transfers(slow_transfer(), failing_transfer())
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
@@ -112,6 +112,7 @@ class StaticContext(IContext):
         self._hub_url = hub_url
         self._org_id = org_id
         self._workspace_id = workspace_id
+        self._environment: Environment | None = None
 
     @classmethod
     def create_copy(cls, context: IContext) -> Self:
@@ -148,12 +149,14 @@ class StaticContext(IContext):
         hub_url = self._hub_url
         if hub_url is None:
             raise ContextError("Can't determine hub URL for connector. Context must have the hub URL set.")
-        return APIConnector(
+        # The context is immutable, so build the connector once and reuse it for every subsequent call.
+        self._connector = APIConnector(
             base_url=hub_url,
             transport=self._transport,
             authorizer=self._authorizer,
             additional_headers=self._additional_headers,
         )
+        return self._connector
 
     def get_cache(self) -> ICache | None:
         """Gets the cache of this context, if any."""
@@ -165,6 +168,8 @@ class StaticContext(IContext):
         :return: The Environment.
         :raises ContextError: If the context does not have sufficient information to create an Environment.
         """
+        if self._environment is not None:
+            return self._environment
         if self._hub_url is None:
             raise ContextError("Can't determine hub URL for the environment. Context must have a hub URL set.")
         if self._org_id is None:
@@ -173,11 +178,12 @@ class StaticContext(IContext):
             )
         if self._workspace_id is None:
             raise ContextError("Can't determine workspace for environment. Context must have a workspace ID set.")
-        return Environment(
+        self._environment = Environment(
             hub_url=self._hub_url,
             org_id=self._org_id,
             workspace_id=self._workspace_id,
         )
+        return self._environment
 
     def get_org_id(self) -> uuid.UUID:
         """Gets the organization ID associated with this context.
@@ -9,6 +9,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
+import weakref
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from contextlib import contextmanager
@@ -27,6 +29,17 @@ logger = logging.getLogger("io.download")
 
 T = TypeVar("T", bound=ResourceMetadata)
 
+# One lock per cache location that is currently being downloaded, so that concurrent requests for the same resource
+# wait for a single download instead of each fetching (and writing) the same file.
+_cache_location_locks: weakref.WeakValueDictionary[Path, asyncio.Lock] = weakref.WeakValueDictionary()
+
+
+def _get_cache_location_lock(location: Path) -> asyncio.Lock:
+    lock = _cache_location_locks.get(location)
+    if lock is None:
+        lock = _cache_location_locks[location] = asyncio.Lock()
+    return lock
+
 
 class Download(ABC, Generic[T]):
     """A base class for referencing binary data that needs to be downloaded.
@@ -142,11 +155,12 @@ class Download(ABC, Generic[T]):
         :raises RetryError: if the maximum number of consecutive attempts have failed.
         """
         location = self._get_cache_location(cache)
-        if not location.exists() or overwrite:
-            await self.download_to_path(
-                filename=location, transport=transport, max_workers=max_workers, retry=retry, fb=fb
-            )
-        else:
-            logger.debug(f"Skipping download because data already in cache (label: {self.label})")
-            fb.progress(1.0)
+        async with _get_cache_location_lock(location):
+            if not location.exists() or overwrite:
+                await self.download_to_path(
+                    filename=location, transport=transport, max_workers=max_workers, retry=retry, fb=fb
+                )
+            else:
+                logger.debug(f"Skipping download because data already in cache (label: {self.label})")
+                fb.progress(1.0)
         return location
@@ -152,5 +152,8 @@ def split_feedback(feedback: IFeedback, weights: Sequence[float]) -> list[IFeedb
     :param weights: Weights for each partial feedback object.
     :returns: A list of ConcurrentFeedback objects.
     """
+    if feedback is NoFeedback:
+        # Nothing would observe the aggregated progress, so skip the locking and bookkeeping entirely
+        return [NoFeedback] * len(weights)
     group = _ConcurrentFeedbackGroup(feedback)
     return [group.create_feedback(weight) for weight in weights]
@@ -11,6 +11,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 from collections.abc import Callable, Iterator, Mapping, Sequence
 from types import MappingProxyType
@@ -162,7 +163,15 @@ def proxy(value: T) -> T: ...
 
 def proxy(value: Any) -> Any:
     """Convert a JSON-like value into a JMESPath proxy type if applicable."""
-    if isinstance(value, Mapping):
+    # Fast paths for the types produced by JSON documents, skipping the ABC isinstance checks below.
+    value_type = type(value)
+    if value_type is dict:
+        return JMESPathObjectProxy(value)
+    elif value_type is list:
+        return JMESPathArrayProxy(value)
+    elif value_type in (str, int, float, bool) or value is None:
+        return value
+    elif isinstance(value, Mapping):
         return JMESPathObjectProxy(value)
     elif isinstance(value, Sequence) and not isinstance(value, str):
         return JMESPathArrayProxy(value)
@@ -184,6 +193,12 @@ def compile(expression: str) -> ParsedResult:
 
     :raises JMESPathError: If the expression is invalid.
     """
+    return _compile_cached(expression)
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_cached(expression: str) -> ParsedResult:
+    # Compiled expressions are immutable, so a single instance can be shared by every caller.
     result = jmespath.compile(expression)
     return ParsedResult(result.expression, result.parsed)
 
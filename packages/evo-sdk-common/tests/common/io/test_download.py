@@ -9,6 +9,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
 from pathlib import Path
 from uuid import UUID
 
@@ -77,3 +78,16 @@ class TestDownload(TestWithDownloadHandler):
         self.assertEqual(expected_data_file, actual_data_file)
         self.assertTrue(expected_data_file.exists())
         self.assertEqual(TEST_DATA, expected_data_file.read_bytes())
+
+    async def test_to_cache_concurrent(self) -> None:
+        """Test concurrent downloads of the same resource to the cache only download it once."""
+        expected_data_file = self.download._get_cache_location(self.cache)
+        self.assertFalse(expected_data_file.exists())
+        actual_data_files = await asyncio.gather(
+            self.download.download_to_cache(self.cache, self.transport),
+            self.download.download_to_cache(self.cache, self.transport),
+        )
+        self.assertEqual(1, self.url_generator.n_calls)
+        self.assert_download_requests(self.url_generator.current_url)
+        self.assertEqual([expected_data_file, expected_data_file], actual_data_files)
+        self.assertEqual(TEST_DATA, expected_data_file.read_bytes())
@@ -42,6 +42,7 @@ class TestStaticContext(TestCase):
         self.assertIs(evo_context.get_cache(), cache)
         connector = evo_context.get_connector()
         self.assertEqual(connector.base_url, BASE_URL)
+        self.assertIs(evo_context.get_connector(), connector)
         with self.assertRaises(ContextError):
             evo_context.get_environment()
 
@@ -63,6 +64,8 @@ class TestStaticContext(TestCase):
         self.assertEqual(environment.hub_url, BASE_URL)
         self.assertEqual(environment.org_id, ORG.id)
         self.assertEqual(environment.workspace_id, WORKSPACE_ID)
+        self.assertIs(evo_context.get_environment(), environment)
+        self.assertIs(evo_context.get_connector(), connector)
 
     def test_from_connector(self):
         connector = Mock()
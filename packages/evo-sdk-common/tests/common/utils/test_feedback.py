@@ -88,6 +88,9 @@ class TestFeedback(unittest.TestCase):
     def test_split_feedback_no_elements(self) -> None:
         self.assertEqual(split_feedback(self.parent_fb, []), [])
 
+    def test_split_no_feedback(self) -> None:
+        self.assertEqual(split_feedback(NoFeedback, [1, 2, 3]), [NoFeedback, NoFeedback, NoFeedback])
+
     @parameterized.expand(
         [
             ("weighted", [1, 2, 3], [0.0, 0.1667, 0.6667, 9 / 12, 0.8333]),
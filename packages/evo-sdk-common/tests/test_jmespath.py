@@ -57,6 +57,10 @@ class TestJMESPath(unittest.TestCase):
         result = evo_jmespath.compile("foo.bar")
         self.assertIsInstance(result, evo_jmespath.ParsedResult, "Expected custom ParsedResult from compile")
 
+    def test_compile_is_cached(self) -> None:
+        """Test that compiling the same expression twice reuses the compiled result."""
+        self.assertIs(evo_jmespath.compile("a.b[0]"), evo_jmespath.compile("a.b[0]"))
+
     def test_search_returns_array_proxy(self) -> None:
         """Test that searching for an array returns our JMESPathArrayProxy."""
         data = {"foo": {"bar": [1, 2, 3]}}